@@ -1,22 +1,23 @@
 #!/usr/bin/env -S uv run --quiet --script
 # /// script
-# dependencies = ["pandas"]
+# dependencies = ["ijson", "orjson"]
 # ///
 """A tool to validate PvPoke CSV rankings against cup inclusion/exclusion rules."""
 
 import argparse
-import json
+import csv
 import os
 import sys
-from typing import Any, Dict, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Set
 
-import pandas as pd
-
-
-def load_json_file(filepath: str) -> Dict[str, Any]:
-    """Loads a JSON file."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+from pvpoke_common import (
+    extract_cup_data_from_json,
+    load_cup_file,
+    load_gamemaster_moves,
+    load_gamemaster_pokemon,
+    print_ids,
+)
 
 
 def load_csv_pokemon_ids(filepath: str, species_name_to_id_map: Dict[str, str]) -> List[str]:
@@ -24,12 +25,18 @@ def load_csv_pokemon_ids(filepath: str, species_name_to_id_map: Dict[str, str])
 
     Returns a list of speciesIds found in the CSV.
     """
-    df = pd.read_csv(filepath)
-    if "Pokemon" not in df.columns:
-        raise ValueError(f"CSV file '{filepath}' must contain a 'Pokemon' column.")
+    # A single column doesn't justify a DataFrame, so read it with the stdlib csv module
+    with open(filepath, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "Pokemon" not in header:
+            raise ValueError(f"CSV file '{filepath}' must contain a 'Pokemon' column.")
+        pokemon_index = header.index("Pokemon")
+
+        csv_pokemon_names = [row[pokemon_index] for row in reader if len(row) > pokemon_index]
 
     correlated_ids = []
-    for csv_pokemon_name in df["Pokemon"].tolist():
+    for csv_pokemon_name in csv_pokemon_names:
         # Direct, case-sensitive lookup only, as per new assumption
         species_id = species_name_to_id_map.get(csv_pokemon_name)
 
@@ -59,61 +66,60 @@ def load_csv_moves(filepath: str, move_name_to_id_map: Dict[str, str]) -> Set[st
 
     Returns a set of unique move IDs (uppercased) found in the CSV.
     """
-    df = pd.read_csv(filepath)
     move_columns = ["Fast Move", "Charged Move 1", "Charged Move 2"]
+    with open(filepath, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        missing_cols = [col for col in move_columns if col not in header]
+        if missing_cols:
+            raise ValueError(
+                f"CSV file '{filepath}' must contain all of the following columns: {move_columns}. "
+                f"Missing: {missing_cols}"
+            )
+        move_indexes = [header.index(col) for col in move_columns]
+        rows = list(reader)
 
-    # Check if all move columns exist
-    if not all(col in df.columns for col in move_columns):
-        missing_cols = [col for col in move_columns if col not in df.columns]
-        raise ValueError(
-            f"CSV file '{filepath}' must contain all of the following columns: {move_columns}. Missing: {missing_cols}"
-        )
+    # Walk column by column so warnings list every fast move before the charged moves
+    csv_move_names = [row[idx] for idx in move_indexes for row in rows if len(row) > idx and row[idx]]
 
-    csv_moves_ids: Set[str] = set()
-    for col in move_columns:
-        for csv_move_name in df[col].dropna().astype(str).tolist():
-            # Clean move name of special PvPoke symbols (* and <sup>†</sup>)
-            cleaned_name = clean_move_name(csv_move_name)
-            move_id = move_name_to_id_map.get(cleaned_name)
-            if move_id:
-                csv_moves_ids.add(move_id)
-            else:
-                print(
-                    f"⚠️ WARNING: Could not correlate CSV move '{csv_move_name}' "
-                    "to a moveId using gamemaster map. Skipping this entry."
-                )
+    csv_move_ids: Set[str] = set()
+    for csv_move_name in csv_move_names:
+        # Clean move names of special PvPoke symbols (* and <sup>†</sup>)
+        move_id = move_name_to_id_map.get(clean_move_name(csv_move_name))
 
-    return csv_moves_ids
+        if move_id:
+            csv_move_ids.add(move_id)
+        else:
+            print(
+                f"⚠️ WARNING: Could not correlate CSV move '{csv_move_name}' "
+                "to a moveId using gamemaster map. Skipping this entry."
+            )
+
+    return csv_move_ids
 
 
 def check_shadow_pokemon(
-    ranked_pokemon_ids: Set[str], all_pokemon_data: List[Dict[str, Any]], shadow_check_mode: str
+    ranked_pokemon_ids: Set[str], released_species_ids: FrozenSet[str], shadow_check_mode: str
 ) -> bool:
     """Checks for missing released shadow Pokémon from the rankings."""
     print("\n--- Shadow Pokémon Check ---")
-    passed = True
-    missing_shadow_pokemon = []
-
-    pokemon_data_map = {p["speciesId"]: p for p in all_pokemon_data}
-
-    for species_id in ranked_pokemon_ids:
-        if species_id.endswith("_shadow"):
-            continue
-
-        shadow_species_id = f"{species_id}_shadow"
-        shadow_pokemon = pokemon_data_map.get(shadow_species_id)
-
-        if shadow_pokemon and shadow_pokemon.get("released", False):
-            if shadow_species_id not in ranked_pokemon_ids:
-                passed = False
-                missing_shadow_pokemon.append(shadow_species_id)
+    shadow_candidate_ids = (
+        f"{species_id}_shadow" for species_id in ranked_pokemon_ids if not species_id.endswith("_shadow")
+    )
+    missing_shadow_pokemon = [
+        shadow_species_id
+        for shadow_species_id in shadow_candidate_ids
+        if shadow_species_id not in ranked_pokemon_ids and shadow_species_id in released_species_ids
+    ]
+    passed = not missing_shadow_pokemon
 
     if not passed:
         prefix_emoji = "❌" if shadow_check_mode == "strict" else "⚠️"
         prefix_text = "ERROR" if shadow_check_mode == "strict" else "WARNING"
-        print(f"{prefix_emoji} {prefix_text}: The following released shadow Pokémon are MISSING from the CSV rankings:")
-        for pokemon_id in sorted(missing_shadow_pokemon):
-            print(f"   - {pokemon_id}")
+        print_ids(
+            f"{prefix_emoji} {prefix_text}: The following released shadow Pokémon are MISSING from the CSV rankings:",
+            missing_shadow_pokemon,
+        )
     else:
         print("✅ All relevant released shadow Pokémon are present in the CSV rankings.")
 
@@ -151,126 +157,84 @@ def main():
     moves_json_path = os.path.join(pvpoke_src_root, "data", "gamemaster", "moves.json")
     pokemon_json_path = os.path.join(pvpoke_src_root, "data", "gamemaster", "pokemon.json")
 
-    # Load data
-    gamemaster_data = load_json_file(gamemaster_json_path)
-    cup_data = load_json_file(args.cup_json_path)
-    all_pokemon_data = load_json_file(pokemon_json_path)
+    # Load data. The four loads are independent, so overlap their file I/O instead of running them back to back
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        gamemaster_future = executor.submit(load_gamemaster_pokemon, gamemaster_json_path)
+        cup_data_future = executor.submit(load_cup_file, args.cup_json_path)
+        pokemon_future = executor.submit(load_gamemaster_pokemon, pokemon_json_path)
+        moves_future = executor.submit(load_gamemaster_moves, moves_json_path)
 
-    # Create species_name_to_id_map from gamemaster
-    species_name_to_id_map = {}
-    pokemon_entries = []
-    if isinstance(gamemaster_data, dict) and "pokemon" in gamemaster_data:
-        pokemon_entries = gamemaster_data.get("pokemon", [])
-    elif isinstance(gamemaster_data, list):
-        pokemon_entries = gamemaster_data
+    _, species_name_to_id_map, _ = gamemaster_future.result()
+    cup_data = cup_data_future.result()
+    _, _, released_species_ids = pokemon_future.result()
+    gamemaster_move_ids, move_name_to_id_map = moves_future.result()
 
-    if not pokemon_entries:
+    if not species_name_to_id_map:
         print(
             f"❌ ERROR: Could not find 'pokemon' array or valid entries in gamemaster JSON "
             f"at '{gamemaster_json_path}'. Aborting."
         )
         exit(1)
 
-    for entry in pokemon_entries:
-        species_id = entry.get("speciesId")
-        species_name = entry.get("speciesName")
-        if species_id and species_name:
-            # Store original speciesName as key, as per new assumption of exact match
-            species_name_to_id_map[species_name] = species_id
-
     ranked_pokemon_ids = set(load_csv_pokemon_ids(args.csv_path, species_name_to_id_map))
 
-    # Extract required and forbidden pokemon IDs from cup JSON
-    required_pokemon_ids = set()
-    forbidden_pokemon_ids = set()
-
-    for rule in cup_data.get("include", []):
-        if rule.get("filterType") == "id" and "values" in rule:
-            for pokemon_id in rule["values"]:
-                required_pokemon_ids.add(pokemon_id)
-
-    # Simple direct exclusion, assuming 'exclude' values are speciesIds
-    for pokemon_id in cup_data.get("exclude", []):
-        if isinstance(pokemon_id, str):  # Direct string exclusion
-            forbidden_pokemon_ids.add(pokemon_id)
-        elif isinstance(pokemon_id, dict) and pokemon_id.get("filterType") == "id" and "values" in pokemon_id:
-            for val in pokemon_id["values"]:
-                forbidden_pokemon_ids.add(val)
+    # Extract required and forbidden pokemon IDs, and forbidden move IDs, from cup JSON
+    required_pokemon_ids, forbidden_pokemon_ids, forbidden_moves_from_cup = extract_cup_data_from_json(cup_data)
 
     # Perform sanity checks
     all_passed = True
 
     print("\n--- Inclusion Check ---")
-    missing_required = required_pokemon_ids - ranked_pokemon_ids
-    if missing_required:
+    # issubset/isdisjoint walk the tiny cup-derived sets and stop at the first hit; the offending IDs are
+    # only collected when a check fails
+    if not required_pokemon_ids.issubset(ranked_pokemon_ids):
         all_passed = False
-        print("❌ ERROR: The following required Pokémon are MISSING from the CSV rankings:")
-        for pokemon_id in sorted(list(missing_required)):
-            print(f"   - {pokemon_id}")
+        missing_required = required_pokemon_ids - ranked_pokemon_ids
+        print_ids("❌ ERROR: The following required Pokémon are MISSING from the CSV rankings:", missing_required)
     else:
         print("✅ All required Pokémon are present in the CSV rankings.")
 
     print("\n--- Exclusion Check ---")
-    unexpected_forbidden = forbidden_pokemon_ids.intersection(ranked_pokemon_ids)
-    if unexpected_forbidden:
+    if not forbidden_pokemon_ids.isdisjoint(ranked_pokemon_ids):
         all_passed = False
-        print("❌ ERROR: The following forbidden Pokémon are UNEXPECTEDLY found in the CSV rankings:")
-        for pokemon_id in sorted(list(unexpected_forbidden)):
-            print(f"   - {pokemon_id}")
+        unexpected_forbidden = forbidden_pokemon_ids & ranked_pokemon_ids
+        print_ids(
+            "❌ ERROR: The following forbidden Pokémon are UNEXPECTEDLY found in the CSV rankings:",
+            unexpected_forbidden,
+        )
     else:
         print("✅ No forbidden Pokémon are present in the CSV rankings.")
 
-    # Load moves data
-    moves_data = load_json_file(moves_json_path)
-
-    # Create move_name_to_id_map from gamemaster
-    move_name_to_id_map: Dict[str, str] = {}
-    for move_entry in moves_data:
-        move_id = move_entry.get("moveId")
-        move_name = move_entry.get("name")
-        if move_id and move_name:
-            move_name_to_id_map[move_name] = move_id.upper()
-
-    # Extract all valid moveIds from the gamemaster (uppercased for comparison)
-    gamemaster_move_ids: Set[str] = set(move_name_to_id_map.values())
-
-    # Extract all forbidden move IDs from cup JSON
-    forbidden_moves_from_cup: Set[str] = set()
-    for rule in cup_data.get("exclude", []):
-        if isinstance(rule, dict) and rule.get("filterType") == "move" and "values" in rule:
-            forbidden_moves_from_cup.update([move_id.upper() for move_id in rule["values"]])
-
     # Validate that all forbidden moves actually exist in the gamemaster
-    unknown_forbidden_moves = forbidden_moves_from_cup - gamemaster_move_ids
-    if unknown_forbidden_moves:
+    if not forbidden_moves_from_cup.issubset(gamemaster_move_ids):
         all_passed = False
+        unknown_forbidden_moves = forbidden_moves_from_cup - gamemaster_move_ids
         print("\n--- Cup Configuration Warning (Moves) ---")
-        print(
-            f"⚠️ WARNING: The following excluded moves in '{args.cup_json_path}' are NOT found in the moves gamemaster:"
+        print_ids(
+            f"⚠️ WARNING: The following excluded moves in '{args.cup_json_path}' are NOT found in the moves gamemaster:",
+            unknown_forbidden_moves,
         )
-        for move_id in sorted(list(unknown_forbidden_moves)):
-            print(f"   - {move_id}")
 
     # Load moves from CSV
     csv_ranked_moves_ids = load_csv_moves(args.csv_path, move_name_to_id_map)
 
     if args.verbose:
         print(f"DEBUG: csv_ranked_moves: {csv_ranked_moves_ids}")
-        print(f"DEBUG: forbidden_moves_from_cup: {forbidden_moves_from_cup}")
+        print(f"DEBUG: forbidden_moves_from_cup: {set(forbidden_moves_from_cup)}")
 
     print("\n--- Forbidden Move Check ---")
-    unexpected_forbidden_moves_in_csv = forbidden_moves_from_cup.intersection(csv_ranked_moves_ids)
-
-    if unexpected_forbidden_moves_in_csv:
+    if not forbidden_moves_from_cup.isdisjoint(csv_ranked_moves_ids):
         all_passed = False
-        print("❌ ERROR: The following forbidden moves are UNEXPECTEDLY found in the CSV rankings:")
-        for move_id in sorted(list(unexpected_forbidden_moves_in_csv)):
-            print(f"   - {move_id}")
+        unexpected_forbidden_moves_in_csv = forbidden_moves_from_cup & csv_ranked_moves_ids
+        print_ids(
+            "❌ ERROR: The following forbidden moves are UNEXPECTEDLY found in the CSV rankings:",
+            unexpected_forbidden_moves_in_csv,
+        )
     else:
         print("✅ No forbidden moves are present in the CSV rankings.")
 
     if args.shadow_check_mode != "off":
-        shadow_check_passed = check_shadow_pokemon(ranked_pokemon_ids, all_pokemon_data, args.shadow_check_mode)
+        shadow_check_passed = check_shadow_pokemon(ranked_pokemon_ids, released_species_ids, args.shadow_check_mode)
         if args.shadow_check_mode == "strict" and not shadow_check_passed:
             all_passed = False
 
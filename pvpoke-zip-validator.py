@@ -1,46 +1,100 @@
 #!/usr/bin/env -S uv run --quiet --script
 # /// script
+# requires-python = ">=3.10"
+# dependencies = ["ijson", "orjson"]
 # ///
 """A tool to validate PvPoke cup data within a zip archive against cup rules."""
 
 import argparse
-import json
+import hashlib
+import multiprocessing
 import os
-import tempfile
+import sys
 import zipfile
-from functools import partial
-from typing import Any, Dict, Optional, Set
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from pvpoke_common import (
+    extract_cup_data_from_json,
+    id_lines,
+    load_cached_by_digest,
+    load_gamemaster_moves,
+    load_gamemaster_pokemon,
+    load_json_bytes,
+    normalize_cup_data,
+    upper_ids,
+)
+
+# Indent of the ID bullets under a data file's error, which is itself nested under "Processing <file>"
+_REPORT_ID_INDENT = "       "
+
+EXPECTED_RANKING_CATEGORIES = frozenset(
+    {
+        "attackers",
+        "chargers",
+        "closers",
+        "consistency",
+        "leads",
+        "overall",
+        "switches",
+    }
+)
 
 
-def load_json_file(filepath: str) -> Any:
-    """Loads a JSON file."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_json_member(zip_ref: zipfile.ZipFile, member_name: str) -> Any:
+    """Loads a JSON file straight out of a zip archive, without extracting it to disk."""
+    with zip_ref.open(member_name) as f:
+        return load_json_bytes(f.read())
 
 
-def extract_cup_data_from_json(cup_data: Dict[str, Any]) -> tuple[Set[str], Set[str], Set[str]]:
-    """Extracts required/forbidden species and moves from cup JSON data.
+@dataclass
+class _CupMembers:
+    """The members of a cup archive, sorted into the cup's sections by _classify_members."""
+
+    names: Set[str] = field(default_factory=set)
+    override_files: List[str] = field(default_factory=list)
+    group_files: List[str] = field(default_factory=list)
+    # Every entry directly under the rankings directory, mapped to the JSON files found beneath it
+    rankings_by_category: Dict[str, List[str]] = field(default_factory=dict)
+
+    def ranking_files(self, rankings_base_path: str) -> List[str]:
+        """Returns all ranking files, with a directory's files before its subdirectories, in name order."""
+
+        def walk_order(name: str) -> List[Tuple[int, str]]:
+            *dirs, filename = name[len(rankings_base_path) :].split("/")
+            return [(1, d) for d in dirs] + [(0, filename)]
+
+        return sorted((name for files in self.rankings_by_category.values() for name in files), key=walk_order)
 
-    Returns (required_species, forbidden_species, forbidden_moves).
-    """
-    required_species_ids: Set[str] = set()
-    forbidden_species_ids: Set[str] = set()
-    forbidden_move_ids: Set[str] = set()
 
-    for rule in cup_data.get("include", []):
-        if rule.get("filterType") == "id" and "values" in rule:
-            required_species_ids.update(rule["values"])
+def _classify_members(
+    zip_ref: zipfile.ZipFile, overrides_base_path: str, rankings_base_path: str, group_base_path: str
+) -> _CupMembers:
+    """Sorts the archive's members into the cup's sections in a single pass over its infolist()."""
+    members = _CupMembers()
+    for info in zip_ref.infolist():
+        name = info.filename
+        members.names.add(name)
+        is_json_file = not info.is_dir() and name.endswith(".json")
 
-    for rule in cup_data.get("exclude", []):
-        if isinstance(rule, str):  # Direct string exclusion for species
-            forbidden_species_ids.add(rule)
-        elif isinstance(rule, dict):
-            if rule.get("filterType") == "id" and "values" in rule:
-                forbidden_species_ids.update(rule["values"])
-            if rule.get("filterType") == "move" and "values" in rule:
-                forbidden_move_ids.update(move_id.upper() for move_id in rule["values"])
+        if name.startswith(rankings_base_path):
+            category = name[len(rankings_base_path) :].split("/", 1)[0]
+            if category:
+                category_files = members.rankings_by_category.setdefault(category, [])
+                if is_json_file:
+                    category_files.append(name)
+        elif not is_json_file:
+            continue
+        elif name.startswith(overrides_base_path) and "/" not in name[len(overrides_base_path) :]:
+            members.override_files.append(name)
+        elif name.startswith(group_base_path) and "/" not in name[len(group_base_path) :]:
+            members.group_files.append(name)
 
-    return required_species_ids, forbidden_species_ids, forbidden_move_ids
+    members.override_files.sort()
+    members.group_files.sort()
+    return members
 
 
 def get_pokemon_and_moves_from_data_file(data: Any) -> tuple[Set[str], Set[str]]:
@@ -48,213 +102,298 @@ def get_pokemon_and_moves_from_data_file(data: Any) -> tuple[Set[str], Set[str]]
 
     Returns (pokemon_ids, move_ids).
     """
-    pokemon_ids: Set[str] = set()
-    move_ids: Set[str] = set()
+    pokemon_ids: Set[str] = {sys.intern(entry["speciesId"]) for entry in data if entry.get("speciesId")}
 
-    for entry in data:
-        species_id = entry.get("speciesId")
-        if species_id:
-            pokemon_ids.add(species_id)
+    # Gather the raw move names first so they are all uppercased in one C-level map
+    fast_moves = (entry["fastMove"] for entry in data if entry.get("fastMove"))
+    charged_moves = (cm for entry in data for cm in entry.get("chargedMoves", []))
+    move_ids = upper_ids(chain(fast_moves, charged_moves))
 
-        fast_move = entry.get("fastMove")
-        if fast_move:
-            move_ids.add(fast_move.upper())
+    return pokemon_ids, move_ids
 
-        charged_moves = entry.get("chargedMoves", [])
-        for cm in charged_moves:
-            move_ids.add(cm.upper())
 
-    return pokemon_ids, move_ids
+# Ranking categories often ship byte-identical files, so extraction results are memoized by content digest
+_member_ids_by_digest: Dict[str, Tuple[Set[str], Set[str]]] = {}
+
+
+def get_pokemon_and_moves_from_member(zip_ref: zipfile.ZipFile, member_name: str) -> Tuple[Set[str], Set[str]]:
+    """Returns get_pokemon_and_moves_from_data_file for a zip member, parsing each distinct content once.
+
+    Results are memoized in memory for this run and on disk for later runs over the same files.
+    The returned sets may be shared between members and must not be modified.
+    """
+    with zip_ref.open(member_name) as f:
+        raw = f.read()
+
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    ids = _member_ids_by_digest.get(digest)
+    if ids is None:
+        ids = load_cached_by_digest(
+            digest, "data-file-ids", lambda: get_pokemon_and_moves_from_data_file(load_json_bytes(raw))
+        )
+        _member_ids_by_digest[digest] = ids
+
+    return ids
 
 
 def _validate_data_file(
-    file_path: str,
+    zip_ref: zipfile.ZipFile,
+    member_name: str,
     base_path: str,
-    gamemaster_species_ids: Set[str],
-    gamemaster_all_move_ids: Set[str],
-    required_species: Set[str],
-    forbidden_species: Set[str],
-    forbidden_moves: Set[str],
+    gamemaster_species_ids: FrozenSet[str],
+    gamemaster_all_move_ids: FrozenSet[str],
+    required_species: FrozenSet[str],
+    forbidden_species: FrozenSet[str],
+    forbidden_moves: FrozenSet[str],
     allowed_pokemon_ids: Optional[Set[str]] = None,
-) -> bool:
+) -> Tuple[bool, List[str]]:
     """Validates a single data file (override or ranking) against all rules.
 
-    Returns True if the file is valid, False otherwise.
+    Returns (is_valid, report), where report holds the lines to print for the file. They are
+    returned rather than printed so a worker process can hand them back to be written in one go.
     """
-    display_path = os.path.relpath(file_path, base_path)
-    print(f"  Processing {display_path}")
+    display_path = member_name[len(base_path) :]
+    report = [f"  Processing {display_path}"]
+
+    pokemon_ids, move_ids = get_pokemon_and_moves_from_member(zip_ref, member_name)
 
-    data = load_json_file(file_path)
-    pokemon_ids, move_ids = get_pokemon_and_moves_from_data_file(data)
+    # issubset/isdisjoint stop at the first offending ID; the full set is only built to report it
 
     # Required species check
-    if required_species:
+    if not required_species.issubset(pokemon_ids):
         missing_species = required_species - pokemon_ids
-        if missing_species:
-            print(f"    ❌ ERROR: Missing required species in {display_path}:")
-            for species_id in sorted(list(missing_species)):
-                print(f"       - {species_id}")
-            return False
+        report.extend(
+            id_lines(f"    ❌ ERROR: Missing required species in {display_path}:", missing_species, _REPORT_ID_INDENT)
+        )
+        return False, report
 
     # Species validation
-    unknown_species = pokemon_ids - gamemaster_species_ids
-    if unknown_species:
-        print(f"    ❌ ERROR: Unknown species in {display_path}:")
-        for species_id in sorted(list(unknown_species)):
-            print(f"       - {species_id}")
-        return False
+    if not pokemon_ids.issubset(gamemaster_species_ids):
+        unknown_species = pokemon_ids - gamemaster_species_ids
+        report.extend(id_lines(f"    ❌ ERROR: Unknown species in {display_path}:", unknown_species, _REPORT_ID_INDENT))
+        return False, report
 
     # Move validation
-    unknown_moves = move_ids - gamemaster_all_move_ids
-    if unknown_moves:
-        print(f"    ❌ ERROR: Unknown moves in {display_path}:")
-        for move_id in sorted(list(unknown_moves)):
-            print(f"       - {move_id}")
-        return False
+    if not move_ids.issubset(gamemaster_all_move_ids):
+        unknown_moves = move_ids - gamemaster_all_move_ids
+        report.extend(id_lines(f"    ❌ ERROR: Unknown moves in {display_path}:", unknown_moves, _REPORT_ID_INDENT))
+        return False, report
 
     # Forbidden species check
-    forbidden_species_found = forbidden_species.intersection(pokemon_ids)
-    if forbidden_species_found:
-        print(f"    ❌ ERROR: Forbidden species found in {display_path}:")
-        for species_id in sorted(list(forbidden_species_found)):
-            print(f"       - {species_id}")
-        return False
+    if not forbidden_species.isdisjoint(pokemon_ids):
+        forbidden_species_found = forbidden_species & pokemon_ids
+        report.extend(
+            id_lines(
+                f"    ❌ ERROR: Forbidden species found in {display_path}:", forbidden_species_found, _REPORT_ID_INDENT
+            )
+        )
+        return False, report
 
     # Forbidden move check
-    forbidden_moves_found = forbidden_moves.intersection(move_ids)
-    if forbidden_moves_found:
-        print(f"    ❌ ERROR: Forbidden moves found in {display_path}:")
-        for move_id in sorted(list(forbidden_moves_found)):
-            print(f"       - {move_id}")
-        return False
+    if not forbidden_moves.isdisjoint(move_ids):
+        forbidden_moves_found = forbidden_moves & move_ids
+        report.extend(
+            id_lines(
+                f"    ❌ ERROR: Forbidden moves found in {display_path}:", forbidden_moves_found, _REPORT_ID_INDENT
+            )
+        )
+        return False, report
 
     # Subset check
-    if allowed_pokemon_ids:
+    if allowed_pokemon_ids and not pokemon_ids.issubset(allowed_pokemon_ids):
         unsupported_species = pokemon_ids - allowed_pokemon_ids
-        if unsupported_species:
-            print(f"    ❌ ERROR: Species in {display_path} not found in the primary override file:")
-            for species_id in sorted(list(unsupported_species)):
-                print(f"       - {species_id}")
-            return False
+        report.extend(
+            id_lines(
+                f"    ❌ ERROR: Species in {display_path} not found in the primary override file:",
+                unsupported_species,
+                _REPORT_ID_INDENT,
+            )
+        )
+        return False, report
 
-    return True
+    return True, report
 
 
-def _validate_overrides(
-    cup_shortname: str,
-    overrides_base_path: str,
-    gamemaster_species_ids: Set[str],
-    gamemaster_all_move_ids: Set[str],
-    required_species: Set[str],
-    forbidden_species: Set[str],
-    forbidden_moves: Set[str],
-) -> bool:
-    """Validates all override files for a given cup.
+# Set once by _set_gamemaster_ids before any section is validated. Worker processes are forked after
+# that, so they inherit these sets rather than receiving a pickled copy with every batch.
+_gamemaster_species_ids: FrozenSet[str] = frozenset()
+_gamemaster_all_move_ids: FrozenSet[str] = frozenset()
+
+
+def _set_gamemaster_ids(species_ids: FrozenSet[str], all_move_ids: FrozenSet[str]) -> None:
+    """Stores the gamemaster sets every _Validator checks against."""
+    global _gamemaster_species_ids, _gamemaster_all_move_ids
+    _gamemaster_species_ids = species_ids
+    _gamemaster_all_move_ids = all_move_ids
+
 
-    Returns True if all overrides are valid, False otherwise.
+@dataclass(slots=True)
+class _Validator:
+    """_validate_data_file bound to the rules of one cup directory, called once per data file.
+
+    Only the per-section rules are held here, so sending a validator to a worker stays cheap; the
+    gamemaster sets are read from the module globals.
     """
-    all_valid = True
-    print(f"\n--- Validating Overrides for {cup_shortname} ---")
-    if not os.path.exists(overrides_base_path):
-        return True  # No overrides to validate
 
-    overrides_files = [
-        os.path.join(overrides_base_path, f) for f in os.listdir(overrides_base_path) if f.endswith(".json")
-    ]
+    base_path: str
+    required_species: FrozenSet[str]
+    forbidden_species: FrozenSet[str]
+    forbidden_moves: FrozenSet[str]
+    allowed_pokemon_ids: Optional[Set[str]] = None
+
+    def __call__(self, zip_ref: zipfile.ZipFile, member_name: str) -> Tuple[bool, List[str]]:
+        return _validate_data_file(
+            zip_ref,
+            member_name,
+            self.base_path,
+            _gamemaster_species_ids,
+            _gamemaster_all_move_ids,
+            self.required_species,
+            self.forbidden_species,
+            self.forbidden_moves,
+            self.allowed_pokemon_ids,
+        )
 
-    validator = partial(
-        _validate_data_file,
-        base_path=overrides_base_path,
-        gamemaster_species_ids=gamemaster_species_ids,
-        gamemaster_all_move_ids=gamemaster_all_move_ids,
-        required_species=required_species,
-        forbidden_species=forbidden_species,
-        forbidden_moves=forbidden_moves,
-    )
 
-    for ov_file in overrides_files:
-        if not validator(file_path=ov_file):
-            all_valid = False
+# Data files totalling less than this are validated in the parent process, as starting workers costs more
+# than it saves on small archives
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
 
-    return all_valid
+# Set in each worker process by _init_worker
+_worker_zip: Optional[zipfile.ZipFile] = None
 
 
-def _validate_rankings(
-    cup_shortname: str,
-    rankings_base_path: str,
-    gamemaster_species_ids: Set[str],
-    gamemaster_all_move_ids: Set[str],
-    required_species: Set[str],
-    forbidden_species: Set[str],
-    forbidden_moves: Set[str],
-) -> bool:
-    """Validates all ranking files for a given cup.
+def _init_worker(zip_path: str) -> None:
+    """Opens the archive for the files handled by this worker process.
 
-    Returns True if all rankings are valid, False otherwise.
+    Each worker opens its own handle, as a forked copy of the parent's would share its file offset.
     """
+    global _worker_zip
+    _worker_zip = zipfile.ZipFile(zip_path, "r")
+
+
+def _validate_data_file_batch(
+    validator: _Validator, member_names: List[str], fail_fast: bool = False
+) -> Tuple[bool, str]:
+    """Validates a batch of data files in a worker process.
+
+    The validator is sent once per batch rather than once per file, so one pool can serve every section.
+    It only carries the section's rules; the gamemaster sets were inherited when the worker was forked.
+    Returns (all_valid, report), with the report lines of every file joined into a single string.
+    """
+    assert _worker_zip is not None
     all_valid = True
-    print(f"\n--- Validating Rankings for {cup_shortname} ---")
+    report: List[str] = []
+    for member_name in member_names:
+        is_valid, file_report = validator(_worker_zip, member_name)
+        report.extend(file_report)
+        if not is_valid:
+            all_valid = False
+            if fail_fast:
+                break
+    return all_valid, "\n".join(report) + "\n"
 
-    validator = partial(
-        _validate_data_file,
-        base_path=rankings_base_path,
-        gamemaster_species_ids=gamemaster_species_ids,
-        gamemaster_all_move_ids=gamemaster_all_move_ids,
-        required_species=required_species,
-        forbidden_species=forbidden_species,
-        forbidden_moves=forbidden_moves,
-    )
 
-    for root, dirs, files in os.walk(rankings_base_path):
-        dirs.sort()
-        for file in sorted(files):
-            if file.endswith(".json"):
-                ranking_file_path = os.path.join(root, file)
-                if not validator(file_path=ranking_file_path):
-                    all_valid = False
-    return all_valid
+def _create_worker_pool(zip_path: str) -> Optional[ProcessPoolExecutor]:
+    """Creates the worker pool shared by every section, or returns None to validate in the parent process.
 
+    Workers are only started once a section is large enough to be submitted to the pool.
+    Only forked workers start quickly enough to pay off, so there is no pool where fork is unavailable,
+    or on macOS, where forking is unsafe with system frameworks and the spawn fallback is several times slower.
+    """
+    max_workers = os.cpu_count() or 1
+    if max_workers == 1 or sys.platform == "darwin" or "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(zip_path,),
+    )
 
-def _validate_groups(
-    cup_shortname: str,
-    group_base_path: str,
-    gamemaster_species_ids: Set[str],
-    gamemaster_all_move_ids: Set[str],
-    required_species: Set[str],
-    forbidden_species: Set[str],
-    forbidden_moves: Set[str],
-    override_pokemon_ids: Set[str],
+
+def _validate_data_files(
+    zip_ref: zipfile.ZipFile,
+    validator: _Validator,
+    member_names: List[str],
+    executor: Optional[ProcessPoolExecutor] = None,
+    fail_fast: bool = False,
 ) -> bool:
-    """Validates all group files for a given cup.
+    """Validates data files from the archive, in the executor's worker processes if the files are large enough.
 
-    Returns True if all groups are valid, False otherwise.
+    Output is printed in the order of member_names, as if the files had been validated one by one.
+    With fail_fast, validation stops at the first invalid file and this call's pending batches are cancelled.
+    The executor itself is left running, as it is shared by every section and shut down by its owner.
+    Returns True if all files are valid, False otherwise.
     """
+    if not member_names:
+        return True
+
+    total_size = sum(zip_ref.getinfo(member_name).file_size for member_name in member_names)
+    if executor is None or len(member_names) == 1 or total_size < _PARALLEL_MIN_BYTES:
+        all_valid = True
+        for member_name in member_names:
+            is_valid, report = validator(zip_ref, member_name)
+            sys.stdout.write("\n".join(report) + "\n")
+            if not is_valid:
+                all_valid = False
+                if fail_fast:
+                    break
+        return all_valid
+
     all_valid = True
-    print(f"\n--- Validating Groups for {cup_shortname} ---")
-    if not os.path.exists(group_base_path):
-        return True  # No groups to validate
+    # Leave each worker several batches to balance load, while batching small files into fewer round trips
+    batch_count = min(len(member_names), (os.cpu_count() or 1) * 4)
+    batch_size = -(-len(member_names) // batch_count)
+    futures = [
+        executor.submit(_validate_data_file_batch, validator, member_names[start : start + batch_size], fail_fast)
+        for start in range(0, len(member_names), batch_size)
+    ]
+    for future in futures:
+        is_valid, output = future.result()
+        sys.stdout.write(output)
+        if not is_valid:
+            all_valid = False
+            if fail_fast:
+                for pending in futures:
+                    pending.cancel()
+                break
+
+    return all_valid
+
 
-    group_files = [os.path.join(group_base_path, f) for f in os.listdir(group_base_path) if f.endswith(".json")]
+def _validate_section(
+    zip_ref: zipfile.ZipFile,
+    section_name: str,
+    cup_shortname: str,
+    base_path: str,
+    member_files: List[str],
+    required_species: FrozenSet[str],
+    forbidden_species: FrozenSet[str],
+    forbidden_moves: FrozenSet[str],
+    allowed_pokemon_ids: Optional[Set[str]] = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+    fail_fast: bool = False,
+) -> bool:
+    """Validates all data files of one section (Overrides, Rankings or Groups) for a given cup.
 
-    validator = partial(
-        _validate_data_file,
-        base_path=group_base_path,
-        gamemaster_species_ids=gamemaster_species_ids,
-        gamemaster_all_move_ids=gamemaster_all_move_ids,
+    Returns True if all of the section's files are valid, False otherwise.
+    """
+    print(f"\n--- Validating {section_name} for {cup_shortname} ---")
+    validator = _Validator(
+        base_path=base_path,
         required_species=required_species,
         forbidden_species=forbidden_species,
         forbidden_moves=forbidden_moves,
-        allowed_pokemon_ids=override_pokemon_ids,
+        allowed_pokemon_ids=allowed_pokemon_ids,
     )
 
-    for group_file in group_files:
-        if not validator(file_path=group_file):
-            all_valid = False
-
-    return all_valid
+    return _validate_data_files(zip_ref, validator, member_files, executor, fail_fast)
 
 
 def _validate_file_structure(
+    zip_ref: zipfile.ZipFile,
+    cup_members: _CupMembers,
     cup_file_path: str,
     overrides_base_path: str,
     rankings_base_path: str,
@@ -267,62 +406,57 @@ def _validate_file_structure(
     """
     all_valid = True
     print("\n--- Validating File Structure ---")
+    # Problems are collected and written once at the end rather than printed line by line
+    report: List[str] = []
 
-    cup_definition = load_json_file(cup_file_path)
+    cup_definition = load_json_member(zip_ref, cup_file_path)
     league = cup_definition.get("league")
     if not league:
         print("    ❌ ERROR: `league` not found in cup definition file.")
         return False
 
     # Validate override file
-    expected_override_file = os.path.join(overrides_base_path, f"{league}.json")
-    if not os.path.exists(expected_override_file):
-        print(f"    ❌ ERROR: Expected override file not found at {expected_override_file}")
+    expected_override_file = f"{overrides_base_path}{league}.json"
+    if expected_override_file not in cup_members.override_files:
+        report.append(f"    ❌ ERROR: Expected override file not found at {expected_override_file}")
         all_valid = False
 
     # Validate group file
-    expected_group_file = os.path.join(group_base_path, f"{cup_shortname}.json")
-    if not os.path.exists(expected_group_file):
-        print(f"    ❌ ERROR: Expected group file not found at {expected_group_file}")
+    expected_group_file = f"{group_base_path}{cup_shortname}.json"
+    if expected_group_file not in cup_members.group_files:
+        report.append(f"    ❌ ERROR: Expected group file not found at {expected_group_file}")
         all_valid = False
 
     # Validate ranking files
-    expected_ranking_categories = {
-        "attackers",
-        "chargers",
-        "closers",
-        "consistency",
-        "leads",
-        "overall",
-        "switches",
-    }
-    found_ranking_categories = set()
-    if os.path.exists(rankings_base_path):
-        found_ranking_categories = set(os.listdir(rankings_base_path))
+    found_ranking_categories = set(cup_members.rankings_by_category)
 
-    missing_categories = expected_ranking_categories - found_ranking_categories
+    missing_categories = EXPECTED_RANKING_CATEGORIES - found_ranking_categories
     if missing_categories:
-        for category in sorted(list(missing_categories)):
-            print(f"    ❌ ERROR: Missing ranking category: {category}")
+        report.extend(f"    ❌ ERROR: Missing ranking category: {category}" for category in sorted(missing_categories))
         all_valid = False
 
-    extra_categories = found_ranking_categories - expected_ranking_categories
-    if extra_categories:
-        for category in sorted(list(extra_categories)):
-            print(f"    ⚠️ WARNING: Extra ranking category found: {category}")
+    extra_categories = found_ranking_categories - EXPECTED_RANKING_CATEGORIES
+    report.extend(f"    ⚠️ WARNING: Extra ranking category found: {category}" for category in sorted(extra_categories))
 
-    for category in found_ranking_categories.intersection(expected_ranking_categories):
-        expected_ranking_file = os.path.join(rankings_base_path, category, f"rankings-{league}.json")
-        if not os.path.exists(expected_ranking_file):
-            print(f"    ❌ ERROR: Expected ranking file not found at {expected_ranking_file}")
+    for category in found_ranking_categories & EXPECTED_RANKING_CATEGORIES:
+        expected_ranking_file = f"{rankings_base_path}{category}/rankings-{league}.json"
+        if expected_ranking_file not in cup_members.rankings_by_category[category]:
+            report.append(f"    ❌ ERROR: Expected ranking file not found at {expected_ranking_file}")
             all_valid = False
 
+    if report:
+        sys.stdout.write("\n".join(report) + "\n")
+
     return all_valid
 
 
-def _run_validation_process(args: argparse.Namespace, pvpoke_src_root: str) -> bool:
+def _run_validation_process(
+    args: argparse.Namespace, pvpoke_src_root: str, executor: Optional[ProcessPoolExecutor] = None
+) -> bool:
     """Runs the entire validation process for a given zip file.
 
+    The executor, if given, is shared by every section that is large enough to validate in parallel.
+
     Returns True if the validation passes, False otherwise.
     """
     gamemaster_pokemon_path = os.path.join(pvpoke_src_root, "data", "gamemaster", "pokemon.json")
@@ -342,16 +476,13 @@ def _run_validation_process(args: argparse.Namespace, pvpoke_src_root: str) -> b
         )
         return False
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        print(f"Unzipping {args.zip_file} to temporary directory: {temp_dir}")
-
-        with zipfile.ZipFile(args.zip_file, "r") as zip_ref:
-            zip_ref.extractall(temp_dir)
+    print(f"Reading {args.zip_file}")
 
+    with zipfile.ZipFile(args.zip_file, "r") as zip_ref:
         cup_shortname = ""
-        for item in os.listdir(temp_dir):
-            if os.path.isdir(os.path.join(temp_dir, item)):
-                cup_shortname = item
+        for name in zip_ref.namelist():
+            if "/" in name:
+                cup_shortname = name.split("/", 1)[0]
                 break
 
         if not cup_shortname:
@@ -360,73 +491,87 @@ def _run_validation_process(args: argparse.Namespace, pvpoke_src_root: str) -> b
 
         print(f"Detected cup shortname: {cup_shortname}")
 
-        cup_file_path = os.path.join(temp_dir, cup_shortname, "cupfile", f"{cup_shortname}.json")
-        overrides_base_path = os.path.join(temp_dir, cup_shortname, "overrides", cup_shortname)
-        rankings_base_path = os.path.join(temp_dir, cup_shortname, "rankings", cup_shortname)
-        group_base_path = os.path.join(temp_dir, cup_shortname, "group")
+        # Member names in a zip always use "/", so the base paths are plain string prefixes
+        cup_file_path = f"{cup_shortname}/cupfile/{cup_shortname}.json"
+        overrides_base_path = f"{cup_shortname}/overrides/{cup_shortname}/"
+        rankings_base_path = f"{cup_shortname}/rankings/{cup_shortname}/"
+        group_base_path = f"{cup_shortname}/group/"
 
-        if not os.path.exists(cup_file_path):
+        cup_members = _classify_members(zip_ref, overrides_base_path, rankings_base_path, group_base_path)
+
+        if cup_file_path not in cup_members.names:
             print(f"Error: Cup definition file not found at {cup_file_path}")
             return False
 
         structure_valid = _validate_file_structure(
+            zip_ref,
+            cup_members,
             cup_file_path,
             overrides_base_path,
             rankings_base_path,
             group_base_path,
             cup_shortname,
         )
+        if args.fail_fast and not structure_valid:
+            return False
 
-        gamemaster_pokemon_data = load_json_file(gamemaster_pokemon_path)
-        gamemaster_moves_data = load_json_file(gamemaster_moves_path)
-
-        gamemaster_species_ids: Set[str] = {
-            entry["speciesId"] for entry in gamemaster_pokemon_data if "speciesId" in entry
-        }
-        gamemaster_all_move_ids: Set[str] = {
-            entry["moveId"].upper() for entry in gamemaster_moves_data if "moveId" in entry
-        }
+        gamemaster_species_ids, _, _ = load_gamemaster_pokemon(gamemaster_pokemon_path)
+        gamemaster_all_move_ids, _ = load_gamemaster_moves(gamemaster_moves_path)
+        # Before the first section, so forked workers inherit the sets
+        _set_gamemaster_ids(gamemaster_species_ids, gamemaster_all_move_ids)
 
-        cup_definition = load_json_file(cup_file_path)
+        cup_definition = normalize_cup_data(load_json_member(zip_ref, cup_file_path))
         required_species, forbidden_species, forbidden_moves = extract_cup_data_from_json(cup_definition)
 
-        overrides_valid = _validate_overrides(
+        overrides_valid = _validate_section(
+            zip_ref,
+            "Overrides",
             cup_shortname,
             overrides_base_path,
-            gamemaster_species_ids,
-            gamemaster_all_move_ids,
+            cup_members.override_files,
             required_species,
             forbidden_species,
             forbidden_moves,
+            executor=executor,
+            fail_fast=args.fail_fast,
         )
+        if args.fail_fast and not overrides_valid:
+            return False
 
-        rankings_valid = _validate_rankings(
+        rankings_valid = _validate_section(
+            zip_ref,
+            "Rankings",
             cup_shortname,
             rankings_base_path,
-            gamemaster_species_ids,
-            gamemaster_all_move_ids,
+            cup_members.ranking_files(rankings_base_path),
             required_species,
             forbidden_species,
             forbidden_moves,
+            executor=executor,
+            fail_fast=args.fail_fast,
         )
+        if args.fail_fast and not rankings_valid:
+            return False
 
         # Extract pokemon IDs from the primary override file for subset validation
         league = cup_definition.get("league")
-        primary_override_file = os.path.join(overrides_base_path, f"{league}.json")
+        primary_override_file = f"{overrides_base_path}{league}.json"
         override_pokemon_ids: Set[str] = set()
-        if os.path.exists(primary_override_file):
-            override_data = load_json_file(primary_override_file)
-            override_pokemon_ids, _ = get_pokemon_and_moves_from_data_file(override_data)
+        if primary_override_file in cup_members.override_files:
+            override_pokemon_ids, _ = get_pokemon_and_moves_from_member(zip_ref, primary_override_file)
 
-        groups_valid = _validate_groups(
+        groups_valid = _validate_section(
+            zip_ref,
+            "Groups",
             cup_shortname,
             group_base_path,
-            gamemaster_species_ids,
-            gamemaster_all_move_ids,
+            cup_members.group_files,
             required_species,
             forbidden_species,
             forbidden_moves,
             override_pokemon_ids,
+            executor=executor,
+            fail_fast=args.fail_fast,
         )
 
         return structure_valid and overrides_valid and rankings_valid and groups_valid
@@ -436,6 +581,11 @@ def main():
     """Main function to parse arguments and run the validation process."""
     parser = argparse.ArgumentParser(description="Validate PvPoke cup data within a zip archive against cup rules.")
     parser.add_argument("zip_file", help="Path to the zip archive containing cup data.")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first invalid file instead of reporting every discrepancy.",
+    )
 
     args = parser.parse_args()
 
@@ -449,7 +599,12 @@ def main():
         )
         exit(1)
 
-    all_valid = _run_validation_process(args, pvpoke_src_root)
+    executor = _create_worker_pool(args.zip_file)
+    try:
+        all_valid = _run_validation_process(args, pvpoke_src_root, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print("\n--- Summary ---")
     if all_valid:
@@ -0,0 +1,327 @@
+"""Shared helpers for the PvPoke validation scripts.
+
+The scripts run standalone through `uv run --script`, which puts this directory on sys.path, so
+they can import this module directly. Any third-party package imported here must also be listed
+in the inline dependency block of every script that uses it.
+"""
+
+import glob
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+# Both packages are in every script's dependency block, so uv always installs them. Without uv they
+# are optional: the stdlib parser is slower but equivalent, and without ijson files are read whole.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pvpoke_tools")
+# Part of every cache file name. Bump it whenever a cached result changes shape, so entries written
+# by older code are never loaded and are pruned instead.
+CACHE_VERSION = 1
+# Cache files not used for this many seconds are pruned
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+_cache_pruned = False
+
+T = TypeVar("T")
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """Parses JSON from raw bytes, such as a member read out of a zip archive."""
+    return _json_loads(data)
+
+
+def load_json_file(filepath: str) -> Any:
+    """Loads a JSON file."""
+    with open(filepath, "rb") as f:
+        return load_json_bytes(f.read())
+
+
+def load_cached(json_path: str, key: str, build_fn: Callable[[], T]) -> T:
+    """Returns the result of build_fn, cached in a pickle keyed by json_path's mtime and size.
+
+    Cache files live under CACHE_DIR rather than next to the JSON so the PvPoke source tree
+    is never modified. Any change to the JSON file's mtime or size invalidates its cached entry.
+    """
+    stat = os.stat(json_path)
+    path_hash = hashlib.sha1(os.path.abspath(json_path).encode("utf-8")).hexdigest()[:12]
+    cache_prefix = os.path.join(CACHE_DIR, f"v{CACHE_VERSION}-{key}-{path_hash}-")
+    cache_path = f"{cache_prefix}{stat.st_mtime_ns}-{stat.st_size}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            result = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    else:
+        _mark_cache_used(cache_path)
+        return result
+
+    result = build_fn()
+    _write_cache(cache_path, result, stale_pattern=f"{glob.escape(cache_prefix)}*.pkl")
+    return result
+
+
+def load_cached_by_digest(digest: str, key: str, build_fn: Callable[[], T]) -> T:
+    """Returns the result of build_fn, cached in a pickle keyed by a digest of its input's content.
+
+    Unlike load_cached, entries are never invalidated: the same content always has the same digest.
+    Entries for content that is no longer seen are pruned once they are older than CACHE_MAX_AGE.
+    """
+    cache_path = os.path.join(CACHE_DIR, f"v{CACHE_VERSION}-{key}-{digest}.pkl")
+
+    try:
+        with open(cache_path, "rb") as f:
+            result = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    else:
+        _mark_cache_used(cache_path)
+        return result
+
+    result = build_fn()
+    _write_cache(cache_path, result)
+    return result
+
+
+def _mark_cache_used(cache_path: str) -> None:
+    """Refreshes cache_path's mtime, which _prune_cache uses as the time the entry was last used."""
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+
+def _prune_cache() -> None:
+    """Removes cache files written for another CACHE_VERSION, or not used within CACHE_MAX_AGE.
+
+    Runs at most once per process, before its first cache write.
+    """
+    global _cache_pruned
+    if _cache_pruned:
+        return
+    _cache_pruned = True
+
+    version_prefix = f"v{CACHE_VERSION}-"
+    oldest_mtime = time.time() - CACHE_MAX_AGE
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            # Temporary files are only pruned by age, as another process may still be writing one
+            is_other_version = entry.name.endswith(".pkl") and not entry.name.startswith(version_prefix)
+            try:
+                if is_other_version or entry.stat().st_mtime < oldest_mtime:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def _write_cache(cache_path: str, result: Any, stale_pattern: Optional[str] = None) -> None:
+    """Atomically writes result to cache_path, after removing any files matching stale_pattern."""
+    # Caching is best effort; a read-only or missing home directory just means no cache.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _prune_cache()
+        if stale_pattern:
+            for stale_path in glob.glob(stale_pattern):
+                os.remove(stale_path)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _iter_pokemon_entries(filepath: str) -> Iterator[Dict[str, Any]]:
+    """Streams the Pokémon entries of a gamemaster file one at a time.
+
+    Both a full gamemaster ({"pokemon": [...]}) and a bare list of entries, such as
+    data/gamemaster/pokemon.json, are supported. Without ijson, the whole file is parsed up front.
+    """
+    if ijson is None:
+        data = load_json_file(filepath)
+        yield from data if isinstance(data, list) else data["pokemon"]
+        return
+
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        prefix = "item" if mm[:1024].lstrip().startswith(b"[") else "pokemon.item"
+        yield from ijson.items(mm, prefix)
+
+
+def _build_pokemon_lookups(filepath: str) -> Tuple[FrozenSet[str], Dict[str, str], FrozenSet[str]]:
+    """Builds the lookups returned by load_gamemaster_pokemon."""
+    species_ids: Set[str] = set()
+    species_name_to_id_map: Dict[str, str] = {}
+    released_species_ids: Set[str] = set()
+
+    for entry in _iter_pokemon_entries(filepath):
+        species_id = entry.get("speciesId")
+        if not species_id:
+            continue
+
+        species_id = sys.intern(species_id)
+        species_ids.add(species_id)
+        if entry.get("speciesName"):
+            # Store original speciesName as key, as per new assumption of exact match
+            species_name_to_id_map[entry["speciesName"]] = species_id
+        if entry.get("released", False):
+            released_species_ids.add(species_id)
+
+    return frozenset(species_ids), species_name_to_id_map, frozenset(released_species_ids)
+
+
+def load_gamemaster_pokemon(filepath: str) -> Tuple[FrozenSet[str], Dict[str, str], FrozenSet[str]]:
+    """Loads the Pokémon lookups derived from a gamemaster file.
+
+    Returns (species_ids, species_name_to_id_map, released_species_ids).
+    """
+    return _load_gamemaster_pokemon(filepath, os.stat(filepath).st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_gamemaster_pokemon(filepath: str, mtime_ns: int) -> Tuple[FrozenSet[str], Dict[str, str], FrozenSet[str]]:
+    """load_gamemaster_pokemon, cached in process by the file's mtime; the on-disk cache tracks it separately."""
+    return load_cached(filepath, "gamemaster-pokemon", lambda: _build_pokemon_lookups(filepath))
+
+
+def _build_move_lookups(filepath: str) -> Tuple[FrozenSet[str], Dict[str, str]]:
+    """Builds the lookups returned by load_gamemaster_moves."""
+    moves_data = load_json_file(filepath)
+    move_ids = frozenset(upper_ids(move_entry["moveId"] for move_entry in moves_data if move_entry.get("moveId")))
+    move_name_to_id_map = {
+        move_entry["name"]: upper_id(move_entry["moveId"])
+        for move_entry in moves_data
+        if move_entry.get("moveId") and move_entry.get("name")
+    }
+
+    return move_ids, move_name_to_id_map
+
+
+def load_gamemaster_moves(filepath: str) -> Tuple[FrozenSet[str], Dict[str, str]]:
+    """Loads the move lookups derived from the moves gamemaster.
+
+    Returns (move_ids, move_name_to_id_map), with all move IDs uppercased.
+    """
+    return _load_gamemaster_moves(filepath, os.stat(filepath).st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_gamemaster_moves(filepath: str, mtime_ns: int) -> Tuple[FrozenSet[str], Dict[str, str]]:
+    """load_gamemaster_moves, cached in process by the file's mtime; the on-disk cache tracks it separately."""
+    return load_cached(filepath, "gamemaster-moves", lambda: _build_move_lookups(filepath))
+
+
+def _normalize_rules(rules: List[Any]) -> List[Dict[str, Any]]:
+    """Rewrites bare string rules (direct speciesId exclusions) as equivalent "id" filter rules."""
+    return [
+        {"filterType": "id", "values": [rule]} if isinstance(rule, str) else rule
+        for rule in rules
+        if isinstance(rule, (str, dict))
+    ]
+
+
+def normalize_cup_data(cup_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalizes the include/exclude rules of already parsed cup data in place, and returns it.
+
+    Every rule comes back in {"filterType": ..., "values": [...]} form, so code walking the rules
+    never has to special-case bare strings.
+    """
+    for section in ("include", "exclude"):
+        cup_data[section] = _normalize_rules(cup_data.get(section, []))
+
+    return cup_data
+
+
+def load_cup_file(filepath: str) -> Dict[str, Any]:
+    """Loads a cup JSON file with its include/exclude rules normalized by normalize_cup_data."""
+    return normalize_cup_data(load_json_file(filepath))
+
+
+def extract_filter_values(rules: List[Dict[str, Any]], filter_type: str) -> Set[str]:
+    """Collects the values of every cup rule with the given filterType in a single pass.
+
+    Expects rules as returned by load_cup_file.
+    """
+    values: Set[str] = set()
+    for rule in rules:
+        if rule.get("filterType") == filter_type:
+            values.update(map(sys.intern, rule.get("values", ())))
+
+    return values
+
+
+def extract_cup_data_from_json(cup_data: Dict[str, Any]) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+    """Extracts required/forbidden species and moves from cup JSON data.
+
+    Expects rules as returned by load_cup_file, and walks the exclude rules only once.
+    Returns (required_species, forbidden_species, forbidden_moves) as frozensets, with the moves uppercased.
+    """
+    required_species_ids = extract_filter_values(cup_data["include"], "id")
+    forbidden_species_ids: Set[str] = set()
+    forbidden_move_ids: Set[str] = set()
+
+    # Each handled filterType maps to the update of the set it feeds; other filter types are ignored
+    exclude_handlers: Dict[str, Callable[[Iterable[str]], None]] = {
+        "id": lambda values: forbidden_species_ids.update(map(sys.intern, values)),
+        "move": forbidden_move_ids.update,
+    }
+    for rule in cup_data["exclude"]:
+        handler = exclude_handlers.get(rule.get("filterType"))
+        if handler:
+            handler(rule.get("values", ()))
+
+    return frozenset(required_species_ids), frozenset(forbidden_species_ids), frozenset(upper_ids(forbidden_move_ids))
+
+
+def upper_id(move_id: str) -> str:
+    """Normalizes a move ID to the interned uppercase form used by the gamemaster.
+
+    Every move ID read from the gamemaster or a cup file is passed through here exactly once, at
+    ingest, either directly or through upper_ids. Code downstream compares the normalized IDs
+    directly and must not call .upper() again.
+    """
+    return sys.intern(move_id.upper())
+
+
+def upper_ids(move_ids: Iterable[str]) -> Set[str]:
+    """Normalizes move IDs as upper_id does, returning them as a set.
+
+    The uppercasing and interning are chained as C-level maps rather than calling upper_id per ID.
+    """
+    return set(map(sys.intern, map(str.upper, move_ids)))
+
+
+def id_lines(header: str, ids: Iterable[str], indent: str = "   ") -> List[str]:
+    """Returns a header line followed by the sorted IDs as a bulleted list, each bullet prefixed by indent."""
+    return [header, *(f"{indent}- {id_}" for id_ in sorted(ids))]
+
+
+def print_ids(header: str, ids: Iterable[str]) -> None:
+    """Prints a header line followed by the sorted IDs as a bulleted list, in a single write."""
+    sys.stdout.write("\n".join(id_lines(header, ids)) + "\n")